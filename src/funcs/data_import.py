@@ -1,34 +1,38 @@
+from typing import TYPE_CHECKING, Any
+
 import matplotlib.pyplot as plt
 import polars as pl
-import seaborn as sns
 from IPython.display import display
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
 
-def import_data(file_path: str) -> pl.DataFrame:
-    """Imports data from a CSV file and returns it as a Polars DataFrame.
+def import_data(file_path: str) -> pl.LazyFrame:
+    """Lazily imports data from a CSV file and returns it as a Polars LazyFrame.
+
+    Nothing is read until the LazyFrame is collected, so filters, casts and
+    dropped columns applied beforehand are pushed down to the CSV scan.
 
     Args:
         file_path (str): The path to the CSV file.
 
     Returns:
-        pl.DataFrame: A Polars DataFrame containing the imported data.
+        pl.LazyFrame: A Polars LazyFrame scanning the imported data.
     """
-    return pl.scan_csv(file_path).collect()
+    return pl.scan_csv(file_path)
 
 
-def column_types(df: pl.DataFrame) -> dict[str, str]:
+def column_types(df: pl.LazyFrame) -> dict[str, str]:
     """Returns a dictionary with column names as keys and their data types as values.
 
     Args:
-        df (pl.DataFrame): The Polars DataFrame to analyze.
+        df (pl.LazyFrame): The Polars LazyFrame to analyze.
 
     Returns:
         dict[str, str]: A dictionary mapping column names to their data types.
     """
-    return {
-        col: str(dtype)
-        for col, dtype in zip(df.columns, df.dtypes, strict=True)
-    }
+    return {col: str(dtype) for col, dtype in df.collect_schema().items()}
 
 
 def describe_data(
@@ -47,13 +51,50 @@ def describe_data(
     df_len: int = df.shape[0]
 
     display("Missing: ")
-    for col in df.columns:
-        null_count = df.get_column(col).null_count()
+    null_counts: pl.DataFrame = df.null_count()
+    for col, null_count in zip(
+        null_counts.columns, null_counts.row(0), strict=True
+    ):
         display(f"{col}: {null_count}/{df_len} ({null_count / df_len:.2%})")
 
-    for col in categorical_features:
-        display(df.get_column(col).value_counts())
+    value_counts: list[pl.DataFrame] = pl.collect_all(
+        [
+            df.lazy().select(pl.col(col).value_counts()).unnest(col)
+            for col in categorical_features
+        ]
+    )
+    for counts in value_counts:
+        display(counts)
+
+    if not metric_features:
+        return
+
+    box_stats: tuple[dict[str, Any], ...] = df.select(
+        [_boxplot_stats(col) for col in metric_features]
+    ).row(0)
+    for i, (col, stats) in enumerate(
+        zip(metric_features, box_stats, strict=True)
+    ):
+        ax: Axes = plt.figure(i).gca()
+        ax.bxp([stats], orientation="horizontal")
+        ax.set_xlabel(col)
+        ax.set_yticks([])
+
+
+def _boxplot_stats(col: str) -> pl.Expr:
+    # Tukey boxplot statistics, as matplotlib computes them, laid out as the
+    # dict Axes.bxp expects.
+    values: pl.Expr = pl.col(col)
+    q1: pl.Expr = values.quantile(0.25, interpolation="linear")
+    q3: pl.Expr = values.quantile(0.75, interpolation="linear")
+    low: pl.Expr = q1 - 1.5 * (q3 - q1)
+    high: pl.Expr = q3 + 1.5 * (q3 - q1)
 
-    for i, col in enumerate(metric_features):
-        plt.figure(i)
-        sns.boxplot(x=col, data=df)
+    return pl.struct(
+        q1=q1,
+        med=values.median(),
+        q3=q3,
+        whislo=values.filter(values >= low).min(),
+        whishi=values.filter(values <= high).max(),
+        fliers=values.filter((values < low) | (values > high)).implode(),
+    ).alias(col)
@@ -1,17 +1,19 @@
 from collections.abc import Sequence
+from itertools import combinations_with_replacement
 from typing import TYPE_CHECKING, Any
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import polars as pl
+import polars.selectors as cs
 import seaborn as sns
 from IPython.display import display
-from sklearn.feature_selection import RFE
+from sklearn.feature_selection import RFECV
 from sklearn.linear_model import LassoCV, LinearRegression
 
 if TYPE_CHECKING:
     from numpy import dtype, ndarray
-    from scipy.sparse._csr import csr_matrix
 
 
 def check_variance(df: pl.DataFrame) -> None:
@@ -20,11 +22,12 @@ def check_variance(df: pl.DataFrame) -> None:
     Args:
         df (pl.DataFrame): The Polars DataFrame to analyze.
     """
-    for col in df.columns:
-        current_column: pl.Series = df.get_column(col)
-        if current_column.dtype == pl.String:
-            continue
-        display(f"{col}: {current_column.var()}")
+    variances: pl.DataFrame = df.select(cs.numeric().var())
+    if variances.width == 0:
+        return
+
+    for col, var in zip(variances.columns, variances.row(0), strict=True):
+        display(f"{col}: {var}")
 
 
 def get_correlation(
@@ -32,14 +35,42 @@ def get_correlation(
 ) -> pd.DataFrame:
     """Calculates the correlation matrix of the DataFrame.
 
+    Null and NaN values are dropped pair by pair, so features with missing
+    values still get a correlation with every other feature.
+
     Args:
         df (pl.DataFrame): The Polars DataFrame to analyze.
         metric_features (Sequence[str]): List of numeric feature names.
 
     Returns:
-        pl.DataFrame: A Polars DataFrame representing the correlation matrix.
+        pd.DataFrame: A Pandas DataFrame representing the correlation matrix.
     """
-    return df.select(metric_features).to_pandas().corr()
+    n_features: int = len(metric_features)
+    corr: ndarray[tuple[Any, ...], dtype[Any]] = np.full(
+        (n_features, n_features), np.nan
+    )
+
+    if n_features > 0:
+        pairs: list[tuple[int, int]] = list(
+            combinations_with_replacement(range(n_features), 2)
+        )
+        corr_values: tuple[float, ...] = (
+            df.select(metric_features)
+            .fill_nan(None)
+            .select(
+                [
+                    pl.corr(metric_features[i], metric_features[j]).alias(
+                        f"{metric_features[i]}|{metric_features[j]}"
+                    )
+                    for i, j in pairs
+                ]
+            )
+            .row(0)
+        )
+        for (i, j), value in zip(pairs, corr_values, strict=True):
+            corr[i, j] = corr[j, i] = value
+
+    return pd.DataFrame(corr, index=metric_features, columns=metric_features)
 
 
 def corr_heatmap(corr: pd.DataFrame) -> None:
@@ -60,43 +91,44 @@ def rfe(
     y_val: pl.Series,
     model: LinearRegression,
 ) -> None:
-    """Performs Recursive Feature Elimination (RFE) to select the optimal number of features.
+    """Performs cross-validated Recursive Feature Elimination (RFECV) to select the optimal number of features.
+
+    The selected features are then scored on the validation set.
 
     Args:
         x_train (pl.DataFrame): Train DataFrame containing regressor features.
         x_val (pl.DataFrame): Validation DataFrame containing regressor features.
         y_train (pl.Series): Train Series containing target variable.
         y_val (pl.Series): Validation Series containing target variable.
-        model (LinearRegression): The model to use for RFE.
+        model (LinearRegression): The model to use for RFECV.
     """
-    high_score: float = 0
-    features_to_select: pd.Series = pd.Series()
-    nof: int = 0
-
-    for n in range(len(x_train.columns)):
-        rfe = RFE(estimator=model, n_features_to_select=n + 1)
-
-        x_train_rfe: ndarray[tuple[Any, ...], dtype[Any]] = rfe.fit_transform(
-            x_train.to_pandas(), y_train.to_pandas()
-        )
-        x_val_rfe: csr_matrix | ndarray[tuple[Any, ...], dtype[Any]] = (
-            rfe.transform(x_val.to_pandas())
-        )
-
-        y_train_pandas: pd.Series[int] = y_train.to_pandas()
-
-        model.fit(x_train_rfe, y_train_pandas)
-
-        val_score: float = float(model.score(x_val_rfe, y_val.to_pandas()))
-
-        if val_score >= high_score:
-            high_score = val_score
-            nof = n + 1
-
-            features_to_select = pd.Series(rfe.support_, index=x_train.columns)
+    # Single-chunk, Fortran-ordered exports let numeric columns be handed
+    # over to scikit-learn without copying them.
+    x_train_np: ndarray[tuple[Any, ...], dtype[Any]] = (
+        x_train.rechunk().to_numpy(order="fortran")
+    )
+    x_val_np: ndarray[tuple[Any, ...], dtype[Any]] = x_val.rechunk().to_numpy(
+        order="fortran"
+    )
+    y_train_np: ndarray[tuple[Any, ...], dtype[Any]] = (
+        y_train.rechunk().to_numpy()
+    )
+    y_val_np: ndarray[tuple[Any, ...], dtype[Any]] = y_val.rechunk().to_numpy()
+
+    selector: RFECV = RFECV(
+        estimator=model, step=1, cv=5, scoring="r2", n_jobs=-1
+    ).fit(x_train_np, y_train_np)
+    support: ndarray[tuple[Any, ...], dtype[Any]] = selector.support_
+    nof: int = int(selector.n_features_)
+
+    model.fit(x_train_np[:, support], y_train_np)
+
+    val_score: float = float(model.score(x_val_np[:, support], y_val_np))
+
+    features_to_select: pd.Series = pd.Series(support, index=x_train.columns)
 
     display(f"Optimal number of features: {nof}")
-    display(f"Score with {nof} features: {high_score}")
+    display(f"Score with {nof} features: {val_score}")
     display(f"Features to select:\n{features_to_select}")
 
 
@@ -114,7 +146,10 @@ def lasso(
         pl.DataFrame: A Polars DataFrame with features and their corresponding coefficients.
     """
     reg = LassoCV()
-    reg.fit(x_train.to_pandas(), y_train.to_pandas())
+    reg.fit(
+        x_train.rechunk().to_numpy(order="fortran"),
+        y_train.rechunk().to_numpy(),
+    )
 
     return pl.DataFrame(
         {
@@ -1,8 +1,9 @@
-from collections.abc import Iterable, Mapping, Sequence
-from itertools import chain
+from collections.abc import Mapping, Sequence
+from functools import cache
 from typing import Literal
 
 import polars as pl
+import polars.selectors as cs
 
 _MODELS: dict[str, tuple[str, ...]] = {
     "audi": (
@@ -220,334 +221,509 @@ _MODELS: dict[str, tuple[str, ...]] = {
     ),
 }
 
+_MODEL_BRANDS: pl.DataFrame = pl.DataFrame(
+    [(model, brand) for brand, models in _MODELS.items() for model in models],
+    schema=["model", "brand_from_model"],
+    orient="row",
+)
+
+_MAX_LEN_TOLERANCE: int = 2
+
+# Full model names that are also prefixes of other models, kept as is instead
+# of being flagged as ::multiple. Without a brand, every brand's models count.
+_AMBIGUOUS_MODELS: frozenset[str] = frozenset(
+    {"viva", "mokka", "verso", "golf", "ka"}
+)
+_AMBIGUOUS_NO_BRAND_MODELS: frozenset[str] = _AMBIGUOUS_MODELS | {"i3", "i8"}
+
+# Every prefix a typed model may take while still being within
+# _MAX_LEN_TOLERANCE characters of the full model name.
+_MODEL_PREFIXES: pl.DataFrame = pl.DataFrame(
+    [
+        (brand, model[:length], model)
+        for brand, models in _MODELS.items()
+        for model in models
+        for length in range(
+            max(len(model) - _MAX_LEN_TOLERANCE, 0), len(model) + 1
+        )
+    ],
+    schema=["Brand", "prefix", "match"],
+    orient="row",
+)
+
+# Number of candidate models per (brand, prefix), and the candidate itself
+# when it is unique, so each row resolves with a single lookup.
+_BRAND_PREFIX_MATCHES: pl.DataFrame = _MODEL_PREFIXES.group_by(
+    ["Brand", "prefix"]
+).agg(
+    pl.len().alias("brand_matches"),
+    pl.col("match").first().alias("brand_match"),
+)
+
+# Same as _BRAND_PREFIX_MATCHES, but across every brand, for rows whose brand
+# is unknown.
+_GLOBAL_PREFIX_MATCHES: pl.DataFrame = _MODEL_PREFIXES.group_by("prefix").agg(
+    pl.len().alias("all_matches"),
+    pl.col("match").first().alias("all_match"),
+)
+
 
 def fill_na(
-    train_df: pl.DataFrame,
-    test_df: pl.DataFrame,
+    train_df: pl.LazyFrame,
+    test_df: pl.LazyFrame,
     metric_features: Sequence[str],
     bool_features: Sequence[str],
-) -> tuple[pl.DataFrame, pl.DataFrame]:
-    """Fills NA values in the DataFrame.
+) -> tuple[pl.LazyFrame, pl.LazyFrame]:
+    """Fills NA values in the LazyFrame.
 
     Args:
-        train_df (pl.DataFrame): Train Polars DataFrame to fill NA values.
-        test_df (pl.DataFrame): Validation Polars DataFrame to fill NA values.
+        train_df (pl.LazyFrame): Train Polars LazyFrame to fill NA values.
+        test_df (pl.LazyFrame): Validation Polars LazyFrame to fill NA values.
         metric_features (Sequence[str]): Metric features to fill NA with median.
         bool_features (Sequence[str]): Boolean features to fill NA with 0.
 
     Returns:
-        tuple[pl.DataFrame, pl.DataFrame]: Tuple containing the modified train and validation DataFrames.
+        tuple[pl.LazyFrame, pl.LazyFrame]: Tuple containing the modified train and validation LazyFrames.
     """
-    fill_map: dict[str, object] = {
-        **{
-            feat: train_df.get_column(feat).median() for feat in metric_features
-        },
-        **dict.fromkeys(bool_features, 0),
-    }
+    fill_map: dict[str, object] = {}
+    if metric_features:
+        fill_map = (
+            train_df.select([pl.col(feat).median() for feat in metric_features])
+            .collect()
+            .row(0, named=True)
+        )
+    fill_map |= dict.fromkeys(bool_features, 0)
+    fill_exprs: list[pl.Expr] = [
+        pl.col(feat).fill_null(value) for feat, value in fill_map.items()
+    ]
 
-    train_filled: pl.DataFrame = train_df.fill_null(fill_map)
-    test_filled: pl.DataFrame = test_df.fill_null(fill_map)
+    train_filled: pl.LazyFrame = train_df.with_columns(fill_exprs)
+    test_filled: pl.LazyFrame = test_df.with_columns(fill_exprs)
 
     return train_filled, test_filled
 
 
 def bind_data(
-    df: pl.DataFrame,
+    df: pl.LazyFrame,
     thresholds: Mapping[str, dict[Literal["lower", "upper"], float | None]],
-) -> pl.DataFrame:
+) -> pl.LazyFrame:
     """Bind data within specified thresholds.
 
     Args:
-        df (pl.DataFrame): Polars DataFrame to be filtered.
+        df (pl.LazyFrame): Polars LazyFrame to be filtered.
         thresholds (Mapping[str, dict[Literal["lower", "upper"], float | None]]):
             A dictionary where keys are column names and values are dictionaries
             with 'lower' and 'upper' keys specifying the threshold values.
 
     Returns:
-        pl.DataFrame: Filtered Polars DataFrame.
+        pl.LazyFrame: Filtered Polars LazyFrame.
     """
+    predicates: list[pl.Expr] = []
     for k, v in thresholds.items():
         if v["lower"] is not None:
-            df = df.filter(pl.col(k) >= v["lower"])
+            predicates.append(pl.col(k) >= v["lower"])
 
         if v["upper"] is not None:
-            df = df.filter(pl.col(k) <= v["upper"])
+            predicates.append(pl.col(k) <= v["upper"])
 
-    return df
+    if not predicates:
+        return df
+
+    return df.filter(pl.all_horizontal(predicates))
 
 
 def remove_unneeded_floats(
-    df: pl.DataFrame,
+    df: pl.LazyFrame,
     unneeded_float_features: Sequence[str],
-) -> pl.DataFrame:
+) -> pl.LazyFrame:
     """Convert specified float columns to integers.
 
     This only strips the decimal part of the float, it does not round the values.
 
     Args:
-        df (pl.DataFrame): Polars DataFrame to be modified.
+        df (pl.LazyFrame): Polars LazyFrame to be modified.
         unneeded_float_features (Sequence[str]): List of column names to convert from float to int.
 
     Returns:
-        pl.DataFrame: Polars DataFrame with specified columns converted to integers.
+        pl.LazyFrame: Polars LazyFrame with specified columns converted to integers.
     """
-    for col in unneeded_float_features:
-        df = df.with_columns(pl.col(col).cast(pl.Int64))
-    return df
+    return df.with_columns(pl.col(unneeded_float_features).cast(pl.Int64))
 
 
-def remove_duplicates(df: pl.DataFrame) -> pl.DataFrame:
-    """Remove duplicate rows from the DataFrame.
+def remove_duplicates(df: pl.LazyFrame) -> pl.LazyFrame:
+    """Remove duplicate rows from the LazyFrame.
 
     Args:
-        df (pl.DataFrame): Polars DataFrame to be modified.
+        df (pl.LazyFrame): Polars LazyFrame to be modified.
 
     Returns:
-        pl.DataFrame: Polars DataFrame with duplicate rows removed.
+        pl.LazyFrame: Polars LazyFrame with duplicate rows removed.
     """
-    return df.unique()
+    return df.unique(keep="any", maintain_order=False)
 
 
 def get_dummies(
-    df_train: pl.DataFrame,
-    df_test: pl.DataFrame,
+    df_train: pl.LazyFrame,
+    df_test: pl.LazyFrame,
     categorical_features: Sequence[str],
-) -> tuple[pl.DataFrame, pl.DataFrame]:
+) -> tuple[pl.LazyFrame, pl.LazyFrame]:
     """Convert categorical features to dummy variables.
 
     Args:
-        df_train (pl.DataFrame): Train Polars DataFrame to be modified.
-        df_test (pl.DataFrame): Validation Polars DataFrame to be modified.
+        df_train (pl.LazyFrame): Train Polars LazyFrame to be modified.
+        df_test (pl.LazyFrame): Validation Polars LazyFrame to be modified.
         categorical_features (Sequence[str]): List of categorical feature names to convert.
 
     Returns:
-        tuple[pl.DataFrame, pl.DataFrame]: Tuple containing the modified train and validation DataFrames.
+        tuple[pl.LazyFrame, pl.LazyFrame]: Tuple containing the modified train and validation LazyFrames.
     """
-    df_train = df_train.to_dummies(
-        columns=categorical_features, drop_first=True
+    # The dummy columns depend on the categories present in the data, so both
+    # frames have to be collected here.
+    train_data, test_data = pl.collect_all([df_train, df_test])
+
+    # Dummies of categoricals are built from their integer codes instead of
+    # hashing every string.
+    to_categorical: pl.Expr = (
+        cs.by_name(categorical_features) & cs.string()
+    ).cast(pl.Categorical)
+
+    train_dummies: pl.DataFrame = train_data.with_columns(
+        to_categorical
+    ).to_dummies(columns=categorical_features, drop_first=True)
+    test_dummies: pl.DataFrame = test_data.with_columns(
+        to_categorical
+    ).to_dummies(columns=categorical_features, drop_first=True)
+
+    train_dummies = train_dummies.with_columns(
+        pl.col(
+            [
+                col
+                for col in train_dummies.columns
+                if col not in train_data.columns
+            ]
+        ).cast(pl.UInt8)
+    )
+    test_dummies = test_dummies.with_columns(
+        pl.col(
+            [
+                col
+                for col in test_dummies.columns
+                if col not in test_data.columns
+            ]
+        ).cast(pl.UInt8)
     )
 
-    df_test = df_test.to_dummies(columns=categorical_features, drop_first=True)
-
-    all_columns: set[str] = set(df_train.columns).union(set(df_test.columns))
-
-    for col in all_columns:
-        if col not in df_train.columns:
-            df_train = df_train.with_columns(pl.lit(0).alias(col))
-        if col not in df_test.columns:
-            df_test = df_test.with_columns(pl.lit(0).alias(col))
-
+    all_columns: set[str] = set(train_dummies.columns).union(
+        set(test_dummies.columns)
+    )
     final_cols: list[str] = sorted(all_columns)
-    df_train = df_train.select(final_cols)
-    df_test = df_test.select(final_cols)
+
+    df_train = (
+        train_dummies.lazy()
+        .with_columns(
+            [
+                pl.lit(0, dtype=pl.UInt8).alias(col)
+                for col in all_columns.difference(train_dummies.columns)
+            ]
+        )
+        .select(final_cols)
+    )
+    df_test = (
+        test_dummies.lazy()
+        .with_columns(
+            [
+                pl.lit(0, dtype=pl.UInt8).alias(col)
+                for col in all_columns.difference(test_dummies.columns)
+            ]
+        )
+        .select(final_cols)
+    )
 
     return df_train, df_test
 
 
 def scale_data(
-    df_train: pl.DataFrame,
-    df_test: pl.DataFrame,
-) -> tuple[pl.DataFrame, pl.DataFrame]:
-    """Scale numerical features in the DataFrame using Min-Max scaling.
+    df_train: pl.LazyFrame,
+    df_test: pl.LazyFrame,
+    metric_features: Sequence[str],
+) -> tuple[pl.LazyFrame, pl.LazyFrame]:
+    """Scale numerical features in the LazyFrame using Min-Max scaling.
+
+    Only the metric features are scaled, dummy and boolean columns are
+    already in [0, 1] and are left untouched.
 
     Args:
-        df_train (pl.DataFrame): Train Polars DataFrame to be modified.
-        df_test (pl.DataFrame): Validation Polars DataFrame to be modified.
+        df_train (pl.LazyFrame): Train Polars LazyFrame to be modified.
+        df_test (pl.LazyFrame): Validation Polars LazyFrame to be modified.
+        metric_features (Sequence[str]): Metric features to be scaled.
 
     Returns:
-        tuple[pl.DataFrame, pl.DataFrame]: Tuple containing the modified train and validation DataFrames.
+        tuple[pl.LazyFrame, pl.LazyFrame]: Tuple containing the modified train and validation LazyFrames.
     """
-    df_train_min = df_train.min().to_dict()
-    df_train_max = df_test.max().to_dict()
-
-    df_train = df_train.with_columns(
-        [
-            (pl.col(col) - df_train_min[col])
-            / (df_train_max[col] - df_train_min[col])
-            for col in df_train.columns
-        ]
+    if not metric_features:
+        return df_train, df_test
+
+    stats: dict[str, float] = (
+        df_train.select(
+            pl.col(metric_features).min().name.suffix("_min"),
+            (
+                pl.col(metric_features).max() - pl.col(metric_features).min()
+            ).name.suffix("_range"),
+        )
+        .collect()
+        .row(0, named=True)
     )
 
-    df_test = df_test.with_columns(
-        [
-            (pl.col(col) - df_train_min[col])
-            / (df_train_max[col] - df_train_min[col])
-            for col in df_test.columns
-        ]
-    )
+    scale_exprs: list[pl.Expr] = [
+        (pl.col(col).cast(pl.Float64) - stats[f"{col}_min"])
+        / stats[f"{col}_range"]
+        for col in metric_features
+    ]
+
+    df_train = df_train.with_columns(scale_exprs)
+    df_test = df_test.with_columns(scale_exprs)
 
     return df_train, df_test
 
 
 def fix_data(
-    df: pl.DataFrame, col_name: str, col_expr: pl.Expr, tags: set[str]
-) -> pl.DataFrame:
+    df: pl.LazyFrame, col_name: str, col_expr: pl.Expr, tags: set[str]
+) -> pl.LazyFrame:
     """Generic function to fix data in a column based on tags.
 
     Args:
-        df (pl.DataFrame): Polars DataFrame to be modified.
+        df (pl.LazyFrame): Polars LazyFrame to be modified.
         col_name (str): Name of the column to be fixed.
         col_expr (pl.Expr): Polars expression for the column.
         tags (set[str]): Set of tags to check against.
 
     Returns:
-        pl.DataFrame: Polars DataFrame with fixed data in the specified column.
+        pl.LazyFrame: Polars LazyFrame with fixed data in the specified column.
     """
-    return df.with_columns(
-        pl.coalesce(
-            *[
-                pl.when(pl.lit(tag).str.contains(col_expr)).then(pl.lit(tag))
-                for tag in tags
-            ],
-            col_expr + pl.lit("::none"),
-        ).alias(col_name)
-    )
+    return fix_columns(df, {col_name: (col_expr, tags)})
 
 
-def fix_models(df: pl.DataFrame) -> pl.DataFrame:
-    """Fix model names in the DataFrame.
+def fix_columns(
+    df: pl.LazyFrame, fixes: Mapping[str, tuple[pl.Expr, set[str]]]
+) -> pl.LazyFrame:
+    """Fix data in several columns based on tags, all in a single with_columns.
 
     Args:
-        df (pl.DataFrame): Polars DataFrame to be modified.
+        df (pl.LazyFrame): Polars LazyFrame to be modified.
+        fixes (Mapping[str, tuple[pl.Expr, set[str]]]):
+            A dictionary where keys are the names of the columns to be fixed
+            and values are tuples with the Polars expression for the column
+            and the set of tags to check against.
 
     Returns:
-        pl.DataFrame: Polars DataFrame with fixed model names.
+        pl.LazyFrame: Polars LazyFrame with fixed data in the specified columns.
     """
-    df = df.with_columns(pl.col("model").str.strip_chars().str.to_lowercase())
-
     return df.with_columns(
-        pl.struct(["model", "Brand"])
-        .map_elements(
-            lambda x: _fix_model_spelling(x["model"], x["Brand"]),
-            return_dtype=pl.String,
-        )
-        .alias("model")
+        [
+            _fix_data_expr(col_expr, tags).alias(col_name)
+            for col_name, (col_expr, tags) in fixes.items()
+        ]
     )
 
 
-def _matches_for_sequence(
-    models: Iterable[str], element: str, tol: int
-) -> list[str]:
-    return [
-        model
-        for model in models
-        if model.startswith(element) and len(model) - len(element) <= tol
-    ]
+def _fix_data_expr(col_expr: pl.Expr, tags: set[str]) -> pl.Expr:
+    lookup: pl.DataFrame = _tag_substrings(frozenset(tags))
 
+    return pl.coalesce(
+        col_expr.replace_strict(
+            lookup.get_column("substring"),
+            lookup.get_column("fixed_tag"),
+            default=None,
+        ),
+        col_expr + pl.lit("::none"),
+    )
 
-def _search_brand_matches(brand: str, element: str, tol: int) -> list[str]:
-    return _matches_for_sequence(_MODELS.get(brand, ()), element, tol)
 
+@cache
+def _tag_substrings(tags: frozenset[str]) -> pl.DataFrame:
+    # Maps every substring of every tag to the first tag, in sorted order,
+    # containing it. Cached, as the same tags are used for every frame.
+    lookup: dict[str, str] = {}
+    for tag in sorted(tags):
+        for start in range(len(tag) + 1):
+            for end in range(start, len(tag) + 1):
+                lookup.setdefault(tag[start:end], tag)
 
-def _search_all_matches(element: str, tol: int) -> list[str]:
-    return _matches_for_sequence(
-        chain.from_iterable(_MODELS.values()), element, tol
+    return pl.DataFrame(
+        {"substring": list(lookup), "fixed_tag": list(lookup.values())}
     )
 
 
-def _resolve_brand(element: str, brand: str, tol: int) -> str:
-    matches: list[str] = _search_brand_matches(brand, element, tol)
+def fix_models(df: pl.LazyFrame) -> pl.LazyFrame:
+    """Fix model names in the LazyFrame.
 
-    if len(matches) > 1:
-        if element in {"viva", "mokka", "verso", "golf", "ka"}:
-            return element
-        return element + "::multiple"
-    if len(matches) == 1:
-        return matches[0]
-    return element + "::none"
+    Args:
+        df (pl.LazyFrame): Polars LazyFrame to be modified.
 
+    Returns:
+        pl.LazyFrame: Polars LazyFrame with fixed model names.
+    """
+    df = df.with_columns(
+        pl.col("model").str.strip_chars().str.to_lowercase().replace("k", "ka")
+    )
 
-def _resolve_no_brand(element: str, tol: int) -> str:
-    if len(element) == 1:
-        return element + "::no_brand"
+    df = df.join(
+        _BRAND_PREFIX_MATCHES.lazy(),
+        left_on=["Brand", "model"],
+        right_on=["Brand", "prefix"],
+        how="left",
+        maintain_order="left",
+    ).join(
+        _GLOBAL_PREFIX_MATCHES.lazy(),
+        left_on="model",
+        right_on="prefix",
+        how="left",
+        maintain_order="left",
+    )
 
-    if element in {"viva", "mokka", "verso", "golf", "ka", "i3", "i8"}:
-        return element
+    has_brand: pl.Expr = pl.col("Brand").is_not_null() & (pl.col("Brand") != "")
+    model: pl.Expr = pl.col("model")
+    n_brand_matches: pl.Expr = pl.col("brand_matches").fill_null(0)
+    n_all_matches: pl.Expr = pl.col("all_matches").fill_null(0)
+
+    brand_model: pl.Expr = (
+        pl.when((n_brand_matches > 1) & model.is_in(_AMBIGUOUS_MODELS))
+        .then(model)
+        .when(n_brand_matches > 1)
+        .then(model + "::multiple")
+        .when(n_brand_matches == 1)
+        .then(pl.col("brand_match"))
+        .otherwise(model + "::none")
+    )
 
-    all_matches: list[str] = _search_all_matches(element, tol)
+    no_brand_model: pl.Expr = (
+        pl.when(model.str.len_chars() == 1)
+        .then(model + "::no_brand")
+        .when(model.is_in(_AMBIGUOUS_NO_BRAND_MODELS))
+        .then(model)
+        .when(n_all_matches > 1)
+        .then(model + "::multiple::no_brand")
+        .when(n_all_matches == 1)
+        .then(pl.col("all_match") + "::no_brand")
+        .otherwise(model + "::none::no_brand")
+    )
 
-    if len(all_matches) > 1:
-        return element + "::multiple::no_brand"
-    if len(all_matches) == 1:
-        return all_matches[0] + "::no_brand"
-    return element + "::none::no_brand"
+    return df.with_columns(
+        pl.when(has_brand)
+        .then(brand_model)
+        .otherwise(no_brand_model)
+        .alias("model")
+    ).drop("brand_matches", "brand_match", "all_matches", "all_match")
 
 
-def _fix_model_spelling(
-    element: str | None, brand: str | None, *, max_len_tolerance: int = 2
-) -> str | None:
-    """Fix model spelling for a given element and brand.
+def fix_no_brand_models(df: pl.LazyFrame) -> pl.LazyFrame:
+    """Fix models with no brand in the LazyFrame.
 
     Args:
-        element (str): The model name to be checked and fixed.
-        brand (str | None): The brand name associated with the element.
-        max_len_tolerance (int, optional): Max len difference between element and actual model. Defaults to 2.
+        df (pl.LazyFrame): Polars LazyFrame to be modified.
 
     Returns:
-        str: The fixed model name or the original element with appropriate suffixes if applicable.
+        pl.LazyFrame: Polars LazyFrame with fixed models that had no brand.
     """
-    if element is None:
-        return element
-
-    if element == "k":
-        element = "ka"
-
-    if brand:
-        return _resolve_brand(element, brand, max_len_tolerance)
+    df = df.with_columns(pl.col("model").str.replace("::.*", ""))
 
-    return _resolve_no_brand(element, max_len_tolerance)
+    return (
+        df.join(_MODEL_BRANDS.lazy(), on="model", how="left")
+        .with_columns(
+            pl.when(pl.col("model") == "x")
+            .then(pl.lit("bmw"))
+            .when(pl.col("model").is_in(["a", "q"]))
+            .then(pl.lit("audi"))
+            .otherwise(
+                pl.coalesce([pl.col("Brand"), pl.col("brand_from_model")])
+            )
+            .alias("Brand")
+        )
+        .drop("brand_from_model")
+    )
 
 
-def fix_no_brand_models(df: pl.DataFrame) -> pl.DataFrame:
-    """Fix models with no brand in the DataFrame.
+def drop_columns(df: pl.LazyFrame, columns_to_drop: set[str]) -> pl.LazyFrame:
+    """Drop specified columns from the LazyFrame.
 
     Args:
-        df (pl.DataFrame): Polars DataFrame to be modified.
+        df (pl.LazyFrame): Polars LazyFrame to be modified.
+        columns_to_drop (set[str]): Set of column names to drop.
 
     Returns:
-        pl.DataFrame: Polars DataFrame with fixed models that had no brand.
+        pl.LazyFrame: Polars LazyFrame with specified columns dropped.
     """
-    df = df.with_columns(pl.col("model").str.replace("::.*", ""))
+    return df.drop(columns_to_drop)
 
-    model_names: list[str] = []
-    model_brands: list[str] = []
-    for brand, models in _MODELS.items():
-        for model in models:
-            model_names.append(model)
-            model_brands.append(brand)
 
-    map_df = pl.DataFrame(
-        {"model": model_names, "brand_from_model": model_brands}
-    )
+def preprocess(  # noqa: PLR0913
+    train_df: pl.LazyFrame,
+    val_df: pl.LazyFrame,
+    *,
+    fixes: Mapping[str, tuple[pl.Expr, set[str]]],
+    thresholds: Mapping[str, dict[Literal["lower", "upper"], float | None]],
+    unneeded_float_features: Sequence[str],
+    columns_to_drop: set[str],
+    metric_features: Sequence[str],
+    bool_features: Sequence[str],
+    categorical_features: Sequence[str],
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Run the whole preprocessing pipeline on the train and validation data.
 
-    df = df.join(map_df, on="model", how="left")
+    NA values are filled first, with medians taken from the unfiltered train
+    data, so no row is lost to a null in a bounded column. The train data is
+    then bound to the thresholds, both frames are cleaned and fixed, and
+    duplicates are removed from the train data. Binding and duplicate removal
+    only apply to the train data. Everything up to here runs lazily and is
+    collected once with the streaming engine before the dummy variables are
+    built. The metric features are then scaled and the result is collected
+    again with the streaming engine.
 
-    df = df.with_columns(
-        pl.coalesce([pl.col("Brand"), pl.col("brand_from_model")]).alias(
-            "Brand"
+    Args:
+        train_df (pl.LazyFrame): Train Polars LazyFrame.
+        val_df (pl.LazyFrame): Validation Polars LazyFrame.
+        fixes (Mapping[str, tuple[pl.Expr, set[str]]]): Columns to fix with
+            fix_columns, see its documentation.
+        thresholds (Mapping[str, dict[Literal["lower", "upper"], float | None]]):
+            Thresholds to bind the train data with, see bind_data.
+        unneeded_float_features (Sequence[str]): List of column names to convert from float to int.
+        columns_to_drop (set[str]): Set of column names to drop.
+        metric_features (Sequence[str]): Metric features to fill NA with median
+            and scale.
+        bool_features (Sequence[str]): Boolean features to fill NA with 0.
+        categorical_features (Sequence[str]): List of categorical feature names to convert.
+
+    Returns:
+        tuple[pl.DataFrame, pl.DataFrame]: Tuple containing the preprocessed train and validation DataFrames.
+    """
+    train_df, val_df = fill_na(train_df, val_df, metric_features, bool_features)
+    train_df = bind_data(train_df, thresholds)
+
+    train_df, val_df = (
+        drop_columns(
+            fix_no_brand_models(
+                fix_models(
+                    fix_columns(
+                        remove_unneeded_floats(df, unneeded_float_features),
+                        fixes,
+                    )
+                )
+            ),
+            columns_to_drop,
         )
+        for df in (train_df, val_df)
     )
+    train_df = remove_duplicates(train_df)
 
-    df = df.with_columns(
-        pl.when(pl.col("model").str.contains("^x$"))
-        .then(pl.lit("bmw"))
-        .when(pl.col("model").str.contains("^[aq]$"))
-        .then(pl.lit("audi"))
-        .otherwise(pl.col("Brand"))
-        .alias("Brand")
+    train_data, val_data = pl.collect_all(
+        [train_df, val_df], engine="streaming"
     )
 
-    return df.drop("brand_from_model")
-
-
-def drop_columns(df: pl.DataFrame, columns_to_drop: set[str]) -> pl.DataFrame:
-    """Drop specified columns from the DataFrame.
+    train_df, val_df = get_dummies(
+        train_data.lazy(), val_data.lazy(), categorical_features
+    )
+    train_df, val_df = scale_data(train_df, val_df, metric_features)
 
-    Args:
-        df (pl.DataFrame): Polars DataFrame to be modified.
-        columns_to_drop (set[str]): Set of column names to drop.
+    train_out, val_out = pl.collect_all([train_df, val_df], engine="streaming")
 
-    Returns:
-        pl.DataFrame: Polars DataFrame with specified columns dropped.
-    """
-    return df.drop(columns_to_drop)
+    return train_out, val_out